@@ -1,28 +1,364 @@
 # -*- coding: utf-8 -*-
 
-from pynetbox.core.query import RequestError
+from itertools import islice
+
+
+def slugify(value):
+    """
+    Convert a name into a NetBox compatible slug.
+
+    The value is normalized with NFKC and accented letters are folded to
+    their ASCII form. NetBox slugs only accept ASCII letters, digits,
+    underscores and hyphens, so characters without an ASCII form (e.g.
+    Cyrillic or CJK) are dropped, as is any other punctuation. Runs of
+    spaces or hyphens become a single hyphen. The string is walked once
+    instead of going through several regular expression passes.
+
+    Args:
+        value (str): The value to convert.
+
+    Returns:
+        str: The slug, in lower case. May be empty when nothing can be kept.
+    """
+    # NFKC ne modifie pas une chaîne ASCII : on évite la normalisation dans le cas courant
+    if not value.isascii():
+        import unicodedata
+        value = unicodedata.normalize("NFKC", value)
+
+    chars = []
+    for c in value:
+        if not c.isascii():
+            # Lettres accentuées : on garde la forme ASCII (é -> e), le reste est supprimé
+            folded = unicodedata.normalize("NFKD", c).encode("ascii", "ignore").decode("ascii")
+            chars.extend(f.lower() for f in folded if f.isalnum() or f == "_")
+        elif c.isalnum() or c == "_":
+            chars.append(c.lower())
+        elif (c.isspace() or c == "-") and chars and chars[-1] != "-":
+            chars.append("-")
+    return "".join(chars).strip("-_")
+
+
+def is_valid_slug(value):
+    """
+    Check that a value only holds the characters NetBox accepts in a slug.
+
+    Args:
+        value (str): The slug to check.
+
+    Returns:
+        bool: True when the slug is non-empty and only made of ASCII letters, digits, underscores and hyphens.
+    """
+    return bool(value) and value.isascii() and all(c.isalnum() or c in "-_" for c in value)
+
+
+def _tag_key(tag):
+    """
+    Build the normalized key of a tag name.
+
+    Composed and decomposed spellings (e.g. "résumé") or full-width forms
+    share the same NFKC key. The key is only used as a fallback for the
+    spellings that match no NetBox tag exactly, see _fetch_tags().
+
+    Args:
+        tag (str): Tag name or slug.
+
+    Returns:
+        str: The NFKC form of the tag.
+    """
+    if tag.isascii():
+        return tag
+    import unicodedata
+    return unicodedata.normalize("NFKC", tag)
+
 
 class DcimManufacturers:
     """
     NetBox DCIM Manufacturer handler for create, update, and delete operations.
     """
 
+    __slots__ = ("api", "data", "state", "check_mode", "tag_cache", "payload", "manufacturer")
+
     MANAGED_FIELDS = ["name", "slug", "description", "tags"]
+    LOOKUP_FIELDS = ["id", "slug", "name"]
+    OVERRIDE_DEFAULTS = {"description": "", "tags": []}
+    # Nombre maximal de valeurs par requête filter(), pour rester sous les limites de taille d'URL
+    FILTER_BATCH_SIZE = 50
 
-    def __init__(self, api, data, state, check_mode=False):
+    def __init__(self, api, data, state, check_mode=False, tag_cache=None, existing=None):
         """
         Initialize the handler.
         :param api: pynetbox API instance
         :param data: dict containing manufacturer data
         :param check_mode: bool indicating Ansible check mode
+        :param tag_cache: optional dict mapping tag spellings to IDs, shared between handlers
+        :param existing: optional list of candidate records returned by prefetch(); skips the lookup request
         """
         self.api = api
         self.data = data
         self.state = state
         self.check_mode = check_mode
+        self.tag_cache = tag_cache if tag_cache is not None else {}
         self.payload = self.build_payload(stage=self.state)
         self.manufacturer = None
-        self.perform_lookup(stage=self.state)
+        self.perform_lookup(stage=self.state, existing=existing)
+
+    @staticmethod
+    def validate(data):
+        """
+        Check the structure of a manufacturer entry without contacting NetBox.
+
+        Args:
+            data (dict): Manufacturer data.
+
+        Returns:
+            list: Error messages, empty when the entry is valid.
+        """
+        if not isinstance(data, dict):
+            return ["entry must be a dict"]
+
+        errors = []
+        name = data.get("name")
+        if not isinstance(name, str) or not name.strip():
+            errors.append("'name' is required and must be a non-empty string")
+        elif not data.get("slug") and not slugify(name):
+            errors.append("no slug can be generated from name '{}', provide 'slug'".format(name))
+
+        # Un slug vide ou nul est généré à partir du nom ; une description nulle est refusée par NetBox
+        if data.get("slug") is not None and not isinstance(data["slug"], str):
+            errors.append("'slug' must be a string")
+        if "description" in data and not isinstance(data["description"], str):
+            errors.append("'description' must be a string")
+
+        if isinstance(data.get("slug"), str) and data["slug"] and not is_valid_slug(data["slug"]):
+            errors.append("'slug' may only contain ASCII letters, digits, underscores and hyphens")
+
+        lookup = data.get("lookup")
+        if lookup is not None and not isinstance(lookup, dict):
+            errors.append("'lookup' must be a dict")
+            lookup = None
+
+        tags = data.get("tags")
+        if "tags" in data and (not isinstance(tags, list) or not all(isinstance(t, str) for t in tags)):
+            errors.append("'tags' must be a list of strings")
+
+        if lookup:
+            # Seuls les champs de LOOKUP_FIELDS permettent de retrouver un manufacturer : les autres seraient ignorés
+            unsupported = sorted(k for k in lookup if k not in DcimManufacturers.LOOKUP_FIELDS)
+            if unsupported:
+                errors.append("'lookup' does not support {}, use id, slug or name".format(", ".join(unsupported)))
+
+            for field in ("name", "slug"):
+                if field in lookup and not (isinstance(lookup[field], str) and lookup[field]):
+                    errors.append("'lookup.{}' must be a non-empty string".format(field))
+            # bool est un sous-type d'int et int() accepte 1.5 ou " 1 " : seuls un entier ou des chiffres ASCII sont admis
+            lookup_id = lookup.get("id")
+            if "id" in lookup and not (
+                (isinstance(lookup_id, int) and not isinstance(lookup_id, bool))
+                or (isinstance(lookup_id, str) and lookup_id.isascii() and lookup_id.isdigit())
+            ):
+                errors.append("'lookup.id' must be an integer")
+
+        return errors
+
+    @classmethod
+    def prefetch(cls, api, entries, stage="merged"):
+        """
+        Fetch the existing manufacturers of several entries at once.
+
+        All lookup IDs are requested together, then all lookup slugs and all
+        lookup names, instead of one request per entry. Each filter call
+        carries at most FILTER_BATCH_SIZE values to keep the URL short.
+
+        Args:
+            api: pynetbox API instance.
+            entries (list): List of manufacturer data dicts.
+            stage (str): The current stage ("merged" or "override").
+
+        Returns:
+            list: For each entry, the list of matching records, or None when the
+            entry has no usable lookup field.
+        """
+        search = [cls._search_fields(data, stage) for data in entries]
+        # Champ prioritaire de chaque entrée : id, puis slug, puis name
+        keys = [next((k for k in cls.LOOKUP_FIELDS if k in fields), None) for fields in search]
+
+        found = {}
+        for key in cls.LOOKUP_FIELDS:
+            values = list(dict.fromkeys(fields[key] for fields, k in zip(search, keys) if k == key))
+            for batch in cls._batches(values):
+                for record in api.dcim.manufacturers.filter(**{key: batch}):
+                    found.setdefault((key, getattr(record, key)), []).append(record)
+
+        return [found.get((k, fields[k]), []) if k else None for fields, k in zip(search, keys)]
+
+    @classmethod
+    def identity_keys(cls, data, stage="merged", existing=None):
+        """
+        List the keys of the NetBox manufacturers an entry may read or write.
+
+        Two entries sharing a key can target the same record, e.g. the first
+        one creates it and the second one overrides it, so they must be
+        processed one after the other.
+
+        Args:
+            data (dict): Manufacturer data.
+            stage (str): The current stage ("merged" or "override").
+            existing (list): Candidate records returned by prefetch() for the entry, if any.
+
+        Returns:
+            set: Keys like ("slug", "cisco") or ("id", 12).
+        """
+        # Les noms et slugs sont uniques sans tenir compte de la casse dans NetBox
+        keys = {
+            ("name", data["name"].lower()),
+            ("slug", (data.get("slug") or slugify(data["name"])).lower()),
+        }
+        for field, value in cls._search_fields(data, stage).items():
+            keys.add((field, value.lower() if isinstance(value, str) else value))
+        keys.update(("id", record.id) for record in existing or [])
+        return keys
+
+    @classmethod
+    def prefetch_tags(cls, api, entries, tag_cache, stage="merged"):
+        """
+        Resolve the tags of several entries at once into the tag cache.
+
+        The tags of all entries are requested together, so handlers built
+        afterwards with the same tag cache do not query NetBox for them.
+        Unknown tags are cached as None, see unknown_tags() to report them.
+
+        Args:
+            api: pynetbox API instance.
+            entries (list): List of manufacturer data dicts.
+            tag_cache (dict): Tag cache to fill, mapping tag spellings to IDs.
+            stage (str): The current stage ("merged" or "override").
+        """
+        # Seuls les stages qui envoient des tags ont besoin de les résoudre
+        if stage not in ("merged", "override"):
+            return
+        tag_names = list(dict.fromkeys(tag for data in entries for tag in data.get("tags") or []))
+        cls._fetch_tags(api, tag_names, tag_cache)
+
+    @classmethod
+    def unknown_tags(cls, data, tag_cache, stage="merged"):
+        """
+        List the tags of an entry that could not be resolved in NetBox.
+
+        Must be called after prefetch_tags() with the same tag cache.
+
+        Args:
+            data (dict): Manufacturer data.
+            tag_cache (dict): Tag cache filled by prefetch_tags().
+            stage (str): The current stage ("merged" or "override").
+
+        Returns:
+            list: Unknown tag names, in the order they were given.
+        """
+        if stage not in ("merged", "override"):
+            return []
+        return [tag for tag in dict.fromkeys(data.get("tags") or []) if tag_cache.get(tag) is None]
+
+    @classmethod
+    def _batches(cls, values):
+        """
+        Split a list of filter values into chunks of FILTER_BATCH_SIZE.
+
+        Args:
+            values (list): Values to split.
+
+        Returns:
+            list: List of value lists, empty when there is no value.
+        """
+        size = cls.FILTER_BATCH_SIZE
+        return [values[i:i + size] for i in range(0, len(values), size)]
+
+    @classmethod
+    def _fetch_tags(cls, api, tag_names, tag_cache):
+        """
+        Add the IDs of the given tags to the tag cache.
+
+        Tags already cached are skipped. The others are matched by slug
+        first, then by name, using the exact spelling given by the user, with
+        bulk filter requests of at most FILTER_BATCH_SIZE values per pass.
+        A spelling that matches no tag exactly falls back to its NFKC key
+        (see _tag_key), but only when a single NetBox tag has that key:
+        distinct tags such as "TAG" and "ＴＡＧ" are never merged. Tags that
+        do not exist are cached as None so they are not requested again.
+
+        Args:
+            api: pynetbox API instance.
+            tag_names (list): Unique tag names to resolve.
+            tag_cache (dict): Tag cache to fill, mapping tag spellings to IDs (None when unknown).
+        """
+        missing = [tag for tag in tag_names if tag not in tag_cache]
+        if not missing:
+            return
+
+        found = {}
+        # Identifiants des tags retournés par NetBox, regroupés par clé NFKC du slug et du nom
+        by_key = {}
+
+        def collect(records, field):
+            for record in records:
+                found[getattr(record, field)] = record.id
+                for value in (record.slug, record.name):
+                    by_key.setdefault(_tag_key(value), set()).add(record.id)
+
+        for batch in cls._batches(missing):
+            collect(api.extras.tags.filter(slug=batch), "slug")
+
+        # Les tags non trouvés par slug sont recherchés par nom
+        missing = [tag for tag in missing if tag not in found]
+        for batch in cls._batches(missing):
+            collect(api.extras.tags.filter(name=batch), "name")
+
+        # Sans correspondance exacte, la forme NFKC est recherchée par nom si elle diffère de l'orthographe donnée
+        missing = [tag for tag in missing if tag not in found]
+        normalized = list(dict.fromkeys(
+            _tag_key(tag) for tag in missing if _tag_key(tag) != tag and _tag_key(tag) not in by_key
+        ))
+        for batch in cls._batches(normalized):
+            collect(api.extras.tags.filter(name=batch), "name")
+
+        for tag in missing:
+            ids = by_key.get(_tag_key(tag), ())
+            # Repli ambigu (plusieurs tags de même clé NFKC) : le tag reste inconnu
+            found[tag] = next(iter(ids)) if len(ids) == 1 else None
+
+        tag_cache.update({tag: found.get(tag) for tag in tag_names if tag not in tag_cache})
+
+    @classmethod
+    def _search_fields(cls, data, stage="merged"):
+        """
+        Select the fields used to locate an existing manufacturer.
+
+        Only the fields NetBox can match on a unique or indexed column are
+        kept, so no useless description or tags filter is ever built.
+
+        Args:
+            data (dict): Manufacturer data.
+            stage (str): The current stage ("merged" or "override").
+
+        Returns:
+            dict: Lookup fields, empty when no lookup should be performed.
+        """
+        lookup = data.get("lookup", {})
+
+        # En stage 'merged', si aucun lookup explicite n’est fourni, on n’essaie pas de retrouver un manufacturer
+        if stage == "merged" and not lookup:
+            return {}
+
+        # Recherche directe dans les champs de recherche
+        search_fields = {k: lookup[k] for k in cls.LOOKUP_FIELDS if k in lookup}
+
+        # En override, fallback sur les données YAML si nécessaire : seuls slug et name sont des champs documentés
+        if not search_fields and stage == "override":
+            # Un slug nul ou vide est généré à partir du nom : il ne sert pas de critère de recherche
+            search_fields = {k: data[k] for k in ("slug", "name") if data.get(k)}
+
+        if "id" in search_fields:
+            search_fields["id"] = int(search_fields["id"])
+        return search_fields
 
     def build_payload(self, stage="merged"):
         """
@@ -34,78 +370,87 @@ class DcimManufacturers:
         Returns:
             dict: Payload containing manufacturer attributes.
         """
-        payload = {
-            "name": self.data["name"],
-            "slug": self.data.get("slug") or self.data["name"].lower().replace(" ", "-"),
-        }
-
+        # En override, les champs absents reprennent leur valeur par défaut ; en merged, seuls les champs fournis sont envoyés
         if stage == "override":
-            payload["description"] = self.data.get("description", "")
-            payload["tags"] = self._resolve_tags(self.data.get("tags", []))
+            values = dict(self.OVERRIDE_DEFAULTS, **self.data)
         elif stage == "merged":
-            if "description" in self.data:
-                payload["description"] = self.data["description"]
-            if "tags" in self.data:
-                payload["tags"] = self._resolve_tags(self.data["tags"])
+            values = self.data
+        else:
+            values = {}
 
-        return payload
+        setters = {
+            "description": lambda value: value,
+            "tags": self._resolve_tags,
+        }
+
+        return {
+            "name": self.data["name"],
+            "slug": self.data.get("slug") or slugify(self.data["name"]),
+            **{field: setter(values[field]) for field, setter in setters.items() if field in values},
+        }
 
     def _resolve_tags(self, tag_names: list) -> list:
         """
-        Convert a list of tag names into a list of tag ID dictionaries.
+        Convert a list of tag names into a list of tag IDs.
+
+        Tags already present in the tag cache are not requested again, see
+        _fetch_tags() for how the others are matched.
 
         Args:
             tag_names (list): List of tag names to resolve.
 
         Returns:
-            list: List of dictionaries like {"id": ...} for each tag.
-        """
-        resolved = []
-        for tag in tag_names:
-            tag_obj = self.api.extras.tags.get(slug=tag)
-            if not tag_obj:
-                tag_obj = self.api.extras.tags.get(name=tag)
-            if not tag_obj:
+            list: List of tag IDs, in the order the tags were given.
+        """
+        # Dédoublonnage en conservant l'ordre d'origine
+        unique = list(dict.fromkeys(tag_names))
+        if not unique:
+            return []
+
+        self._fetch_tags(self.api, unique, self.tag_cache)
+
+        for tag in unique:
+            if self.tag_cache.get(tag) is None:
                 raise Exception("Tag '{}' not found in NetBox.".format(tag))
-            resolved.append(tag_obj.id)
-        return resolved
+        # Deux orthographes peuvent désigner le même tag : ses identifiants ne sont envoyés qu'une fois
+        return list(dict.fromkeys(self.tag_cache[tag] for tag in unique))
 
-    def perform_lookup(self, stage="merged"):
+    def perform_lookup(self, stage="merged", existing=None):
         """
         Try to locate an existing manufacturer using lookup keys, then fallback depending on the stage.
 
         Args:
             stage (str): The current stage ("merged" or "override").
+            existing (list): Candidate records already fetched by prefetch(), if any.
         """
-        lookup = self.data.get("lookup", {})
-
-        # En stage 'merged', si aucun lookup explicite n’est fourni, on n’essaie pas de retrouver un manufacturer
-        if stage == "merged" and not lookup:
-            self.manufacturer = None
-            return
-
-        # Recherche directe dans les champs gérés
-        search_fields = {k: lookup[k] for k in lookup if k in self.MANAGED_FIELDS}
-
-        # En override, fallback sur les données YAML si nécessaire
-        if not search_fields and stage == "override":
-            search_fields = {k: self.data[k] for k in self.MANAGED_FIELDS if k in self.data}
+        search_fields = self._search_fields(self.data, stage)
 
         # Si aucun champ exploitable : abandon
         if not search_fields:
             self.manufacturer = None
             return
 
-
         # Tentative de récupération priorisée
-        if "slug" in search_fields:
-            self.manufacturer = self.api.dcim.manufacturers.get(slug=search_fields["slug"])
-        elif "name" in search_fields:
-            results = list(self.api.dcim.manufacturers.filter(name=search_fields["name"]))
-            if len(results) == 1:
-                self.manufacturer = results[0]
-            elif len(results) > 1:
-                raise Exception("Multiple manufacturers found with name '{}'.".format(search_fields["name"]))
+        if existing is not None:
+            results = existing
+        elif "id" in search_fields:
+            # Accès direct par clé primaire
+            record = self.api.dcim.manufacturers.get(search_fields["id"])
+            results = [record] if record else []
+        elif "slug" in search_fields:
+            record = self.api.dcim.manufacturers.get(slug=search_fields["slug"])
+            results = [record] if record else []
+        else:
+            # Deux résultats suffisent pour distinguer 0, 1 ou plusieurs manufacturers
+            matches = self.api.dcim.manufacturers.filter(name=search_fields["name"], limit=2)
+            results = list(islice(matches, 2))
+
+        if len(results) == 1:
+            self.manufacturer = results[0]
+        elif len(results) > 1:
+            raise Exception("Multiple manufacturers found with name '{}'.".format(search_fields.get("name")))
+        else:
+            self.manufacturer = None
 
     def is_different(self, stage="merged"):
         """
@@ -119,39 +464,24 @@ class DcimManufacturers:
         if not self.manufacturer:
             return True
 
-        # Construction de l'état actuel du manufacturer
-        current = {
-            "name": self.manufacturer.name,
-            "slug": self.manufacturer.slug,
-            "description": self.manufacturer.description,
-            "tags": sorted([t["id"] for t in self.manufacturer.tags]),
-        }
-
-        # Construction de l'état désiré du manufacturer
-        desired = {
-            "name": self.payload["name"],
-            "slug": self.payload["slug"],
-            "description": self.payload.get("description", ""),
-            "tags": sorted(self.payload.get("tags", [])),
-        }
-
-        # Comparer les états actuels et désirés
+        # Comparer les états actuels et désirés en une seule passe sur MANAGED_FIELDS
         changes = {}
 
-        # Vérification des champs dans MANAGED_FIELDS
         for field in self.MANAGED_FIELDS:
-            if field not in desired:
+            # En stage "merged", un champ absent de self.data n'est pas dans le payload : on ne le supprime pas
+            if stage == "merged" and field not in self.payload:
+                continue
+
+            if field == "tags":
+                # L'ordre des tags n'a pas d'importance : comparaison par ensemble, la liste triée sert de mise à jour
+                desired = self.payload.get("tags", [])
+                if frozenset(desired) != frozenset(t["id"] for t in self.manufacturer.tags):
+                    changes["tags"] = sorted(desired)
                 continue
-            if desired[field] != current.get(field):
-                changes[field] = desired[field]
 
-        # Si on est dans le stage "merged", on évite les suppressions de champs comme "description"
-        if stage == "merged":
-            # Supprimer uniquement les suppressions implicites (ex: champ absent de self.data)
-            if "description" in changes and "description" not in self.data:
-                del changes["description"]
-            if "tags" in changes and "tags" not in self.data:
-                del changes["tags"]
+            desired = self.payload.get(field, "")
+            if desired != getattr(self.manufacturer, field):
+                changes[field] = desired
 
         return changes
 
@@ -160,6 +490,7 @@ class DcimManufacturers:
         Ensure the manufacturer is present and updated if needed.
         :return: dict with operation result
         """
+        from pynetbox.core.query import RequestError
 
         if not self.manufacturer:
 
@@ -37,31 +37,34 @@ options:
       lookup:
         description:
           - Optional lookup fields to identify the existing manufacturer.
-          - If not specified, the module will attempt to match using name and slug.
+          - At least one of I(id), I(slug) or I(name) is required; other keys are rejected.
+          - If not specified, the module will attempt to match using name and slug in C(override) state only.
         required: false
         type: dict
         suboptions:
+          id:
+            description:
+              - NetBox ID to use for lookup.
+              - Takes precedence over the other lookup fields.
+            type: int
           name:
             description: Name to use for lookup.
             type: str
           slug:
             description: Slug to use for lookup.
             type: str
-          description:
-            description: Description to use for lookup.
-            type: str
-          tags:
-            description:
-              - List of tags used for lookup. All tags must match.
-              - Useful to disambiguate when multiple manufacturers share the same name or description.
-            type: list
-            elements: str
   state:
     description:
       - Desired state of the object.
     default: present
     choices: [ absent, present, override ]
     type: str
+  workers:
+    description:
+      - Number of manufacturers processed in parallel.
+      - Each manufacturer is handled in its own thread, as the work is mostly waiting on the NetBox API.
+    default: 8
+    type: int
 author:
   - "YannkeeDelta (@yannkeedelta)"
 '''
@@ -88,13 +91,13 @@ EXAMPLES = r'''
         tags: [networking]
         state: override
 
-- name: Lookup with additional fields
+- name: Rename a manufacturer found by its slug
   yannkeedelta.netbox.dcim_manufacturers:
     manufacturers:
-      - name: HP
+      - name: Hewlett Packard Enterprise
+        slug: hpe
         lookup:
-          description: Hewlett-Packard Inc.
-          tags: [hardware]
+          slug: hp
 '''
 
 RETURN = r'''
@@ -116,18 +119,79 @@ updates:
   returned: when changes were made during update
 '''
 
-from ansible.module_utils.basic import AnsibleModule
-import pynetbox
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from ansible_collections.yannkeedelta.netbox.plugins.module_utils.dcim_manufacturers import DcimManufacturers
 
 
+def build_session(pool_size):
+    """
+    Build the HTTP session shared by all NetBox requests of the module run.
+
+    Connections are kept alive and pooled, so the TCP and TLS handshakes are
+    paid once per worker instead of once per request. Connection errors on
+    idempotent requests are retried with a short backoff.
+
+    Args:
+        pool_size (int): Maximum number of connections kept open, one per worker.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                          max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def group_entries(keys):
+    """
+    Group the entries that share at least one identity key.
+
+    Args:
+        keys (list): For each entry, the set returned by DcimManufacturers.identity_keys().
+
+    Returns:
+        list: Lists of entry indexes, in input order within each group.
+    """
+    parent = list(range(len(keys)))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    first = {}
+    for index, entry_keys in enumerate(keys):
+        for key in entry_keys:
+            if key in first:
+                parent[find(index)] = find(first[key])
+            else:
+                first[key] = index
+
+    groups = {}
+    for index in range(len(keys)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
 def main():
     argument_spec = dict(
         netbox_url=dict(type='str', required=False),
         netbox_token=dict(type='str', required=False, no_log=True),
         manufacturers=dict(type='list', elements='dict', required=True),
         state=dict(type='str', choices=['merged', 'override', 'absent'], default='merged'),
+        workers=dict(type='int', default=8),
     )
 
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
@@ -136,31 +200,97 @@ def main():
     netbox_token = module.params['netbox_token'] or os.getenv('NETBOX_API_TOKEN')
     state = module.params['state']
     manufacturers = module.params['manufacturers']
+    workers = module.params['workers']
 
     if not netbox_url or not netbox_token:
         module.fail_json(msg="NetBox URL and token must be provided either via parameters or environment variables")
+    if workers < 1:
+        module.fail_json(msg="workers must be a positive integer, got {}".format(workers))
+
+    # Validation de toutes les entrées avant tout appel réseau
+    errors = [
+        "manufacturers[{}]: {}".format(index, error)
+        for index, manufacturer in enumerate(manufacturers)
+        for error in DcimManufacturers.validate(manufacturer)
+    ]
+    if errors:
+        module.fail_json(msg="Invalid manufacturer definitions: {}".format("; ".join(errors)), errors=errors)
+
+    # Import différé : pynetbox n'est chargé qu'une fois les paramètres validés
+    try:
+        import pynetbox
+    except ImportError:
+        module.fail_json(msg=missing_required_lib("pynetbox"), exception=traceback.format_exc())
 
     nb = pynetbox.api(netbox_url, token=netbox_token)
+    nb.http_session = build_session(pool_size=workers)
 
     results = []
     changed = False
+    # Cache des tags partagé entre tous les manufacturers de l'exécution
+    tag_cache = {}
+    # Recherche groupée des tags et des manufacturers existants au lieu d'une requête par entrée
+    DcimManufacturers.prefetch_tags(nb, manufacturers, tag_cache, stage=state)
+    # Les tags inconnus sont signalés pour toutes les entrées avant la moindre écriture
+    errors = [
+        "manufacturers[{}]: tag '{}' not found in NetBox".format(index, tag)
+        for index, manufacturer in enumerate(manufacturers)
+        for tag in DcimManufacturers.unknown_tags(manufacturer, tag_cache, stage=state)
+    ]
+    if errors:
+        module.fail_json(msg="Unknown tags: {}".format("; ".join(errors)), errors=errors)
+    existing = DcimManufacturers.prefetch(nb, manufacturers, stage=state)
 
-    for manufacturer in manufacturers:
-        handler = DcimManufacturers(api=nb, data=manufacturer, state=state, check_mode=module.check_mode)
+    def process(manufacturer, candidates):
+        handler = DcimManufacturers(api=nb, data=manufacturer, state=state, check_mode=module.check_mode,
+                                    tag_cache=tag_cache, existing=candidates)
 
         if state == "merged":
-            result = handler.ensure_present()
+            return handler.ensure_present()
         elif state == "override":
-            result = handler.override()
+            return handler.override()
         elif state == "absent":
-            result = handler.ensure_absent()
-        else:
-            result = None
-            module.fail_json(msg="Invalid state: {}".format(state))
+            return handler.ensure_absent()
+        return {"failed": True, "msg": "Invalid state: {}".format(state)}
+
+    # Positionné dès qu'une entrée échoue : les entrées pas encore commencées ne sont plus traitées
+    stop = threading.Event()
+
+    def process_group(indexes):
+        done = {}
+        for position, index in enumerate(indexes):
+            if stop.is_set():
+                break
+            # Seule la première entrée du groupe utilise le prefetch : les suivantes voient les changements des précédentes
+            candidates = existing[index] if position == 0 else None
+            try:
+                result = process(manufacturers[index], candidates)
+            except Exception as e:
+                result = {"failed": True, "msg": str(e), "exception": traceback.format_exc()}
+            done[index] = result
+            if result.get("failed", False):
+                stop.set()
+                break
+        return done
+
+    # Les entrées qui visent un même manufacturer sont traitées à la suite, les groupes en parallèle
+    groups = group_entries([
+        DcimManufacturers.identity_keys(m, stage=state, existing=c) for m, c in zip(manufacturers, existing)
+    ])
 
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_group, group) for group in groups]
 
+    # Les résultats sont remis dans l'ordre d'entrée une fois tous les groupes terminés ou abandonnés
+    done = {}
+    for future in futures:
+        done.update(future.result())
+    for index in sorted(done):
+        result = done[index]
         if result.get("failed", False):
-            module.fail_json(**result)
+            # Les modifications déjà appliquées sont remontées avec le premier échec
+            applied = [r for r in (done[i] for i in sorted(done)) if not r.get("failed", False)]
+            module.fail_json(changed=any(r.get("changed", False) for r in applied), results=applied, **result)
 
         results.append(result)
         if result.get("changed", False):